@@ -4,23 +4,50 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import time
 import os
 import shutil
+import tempfile
 import pandas as pd
+from projection_blend import ProjectionBlender, source_from_frame
 
+# DailyFantasyFuel site slug -> suffix used for the cheatsheet file name
+SITES = {
+    'fanduel': 'FD',
+    'draftkings': 'DK'
+}
 
-def download_projections(date_str):
-    try:
-        input_date = datetime.strptime(date_str, '%Y-%m-%d')
-    except ValueError:
-        print("Please enter date in YYYY-MM-DD format")
-        return
+# Columns that identify a player across the BettingPros and DailyFantasyFuel tables
+BLEND_KEYS = ['last_name', 'team', 'position']
+
+# DailyFantasyFuel's own points projection in its cheatsheet CSVs
+DFF_PROJECTION_COLUMN = 'ppg_projection'
+
+# Relative weight of each projection source in the blended points
+BLEND_WEIGHTS = {
+    'bettingpros': 1.0,
+    'dailyfantasyfuel': 1.0
+}
+
+# Chrome (and Firefox) write in-progress downloads under these extensions
+PARTIAL_SUFFIXES = ('.crdownload', '.part', '.tmp')
 
-    # Setup directories
-    download_dir = r"C:\Downloads"
-    target_dir = r"C:\Users\gohar\PycharmProjects\pythonProject7"
 
+def wait_for_download(download_dir, timeout, poll_interval=0.1):
+    """Return the path of the finished download in download_dir once no partial files remain"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        files = [f for f in os.listdir(download_dir) if not f.startswith('.')]
+        complete = [f for f in files if not f.endswith(PARTIAL_SUFFIXES)]
+        if complete and len(complete) == len(files):
+            return os.path.join(download_dir, complete[0])
+        time.sleep(poll_interval)
+    raise TimeoutError(f"No completed download in {download_dir} after {timeout}s")
+
+
+def download_site_csv(site, date_str, download_dir, timeout):
+    """Download one site's projections CSV into its own empty directory and return the file path"""
     chrome_options = webdriver.ChromeOptions()
     prefs = {
         "download.default_directory": download_dir,
@@ -29,67 +56,57 @@ def download_projections(date_str):
     }
     chrome_options.add_experimental_option("prefs", prefs)
 
-    # Initialize the driver
     driver = webdriver.Chrome(options=chrome_options)
 
     try:
-        # Record initial files in download directory
-        initial_files = set(os.listdir(download_dir))
-
-        # Download FanDuel projections
-        print("Downloading FanDuel projections...")
-        fd_url = f"https://www.dailyfantasyfuel.com/nfl/showdown-single-game-projections/fanduel/{date_str}/"
-        driver.get(fd_url)
+        print(f"Downloading {site} projections...")
+        url = f"https://www.dailyfantasyfuel.com/nfl/showdown-single-game-projections/{site}/{date_str}/"
+        driver.get(url)
 
         wait = WebDriverWait(driver, 10)
-        fd_csv_button = wait.until(EC.element_to_be_clickable(
+        csv_button = wait.until(EC.element_to_be_clickable(
             (By.XPATH, "//span[contains(text(), 'CSV')]")))
-        fd_csv_button.click()
-        time.sleep(3)
+        csv_button.click()
 
-        # Download DraftKings projections
-        print("Downloading DraftKings projections...")
-        dk_url = f"https://www.dailyfantasyfuel.com/nfl/showdown-single-game-projections/draftkings/{date_str}/"
-        driver.get(dk_url)
+        # The driver must stay open until Chrome has finished writing the file
+        return wait_for_download(download_dir, timeout)
+    finally:
+        driver.quit()
 
-        dk_csv_button = wait.until(EC.element_to_be_clickable(
-            (By.XPATH, "//span[contains(text(), 'CSV')]")))
-        dk_csv_button.click()
-        time.sleep(3)
 
-    except Exception as e:
-        print(f"An error occurred during download: {str(e)}")
+def download_projections(date_str, target_dir=None, download_root=None, download_timeout=30):
+    try:
+        input_date = datetime.strptime(date_str, '%Y-%m-%d')
+    except ValueError:
+        print("Please enter date in YYYY-MM-DD format")
         return
-    finally:
-        driver.quit()
+
+    # Setup directories: each site downloads into its own subfolder of a per-run temp directory,
+    # so whatever lands there can only belong to that site
+    if target_dir is None:
+        target_dir = os.getcwd()
+    # Chrome needs an absolute download directory, but mkdtemp keeps a relative download_root relative
+    run_dir = os.path.abspath(tempfile.mkdtemp(prefix='dff_downloads_', dir=download_root))
+    site_dirs = {site: os.path.join(run_dir, code) for site, code in SITES.items()}
+    for site_dir in site_dirs.values():
+        os.makedirs(site_dir)
 
     try:
-        # Get list of new files (files that weren't there initially)
-        final_files = set(os.listdir(download_dir))
-        new_files = final_files - initial_files
-
-        # Get full paths of new files
-        new_file_paths = [os.path.join(download_dir, f) for f in new_files]
-
-        # Sort files by modification time (newest first)
-        sorted_files = sorted(new_file_paths,
-                              key=lambda x: os.path.getmtime(x),
-                              reverse=True)
-
-        if len(sorted_files) >= 2:
-            # First file (newest) is DraftKings, Second file is FanDuel
-            dk_path = sorted_files[0]
-            fd_path = sorted_files[1]
-
-            # Move files to target directory with correct names
-            shutil.move(dk_path, os.path.join(target_dir, "DFF_NFL_cheatsheet_DK.csv"))
-            shutil.move(fd_path, os.path.join(target_dir, "DFF_NFL_cheatsheet_FD.csv"))
-            print("Files have been successfully renamed and moved.")
-        else:
-            print("Could not find both downloaded files. Please check the downloads manually.")
+        # Download FanDuel and DraftKings projections at the same time
+        with ThreadPoolExecutor(max_workers=len(SITES)) as executor:
+            futures = {site: executor.submit(download_site_csv, site, date_str, site_dirs[site], download_timeout)
+                       for site in SITES}
+            downloaded = {site: future.result() for site, future in futures.items()}
+
+        # Move files to target directory with correct names
+        for site, path in downloaded.items():
+            shutil.move(path, os.path.join(target_dir, f"DFF_NFL_cheatsheet_{SITES[site]}.csv"))
+        print("Files have been successfully renamed and moved.")
 
     except Exception as e:
-        print(f"An error occurred while processing files: {str(e)}")
+        print(f"An error occurred during download: {str(e)}")
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
@@ -110,18 +127,38 @@ nfl_fantasy_combined = nfl_fantasy_combined.rename(columns=str.lower)
 dff_nfl_cheatsheet_fd = dff_nfl_cheatsheet_fd.rename(columns=str.lower)
 dff_nfl_cheatsheet_dk = dff_nfl_cheatsheet_dk.rename(columns=str.lower)
 
+# Blend the BettingPros line with DailyFantasyFuel's projection for each site.
+# The BettingPros column is shared, so switching sites only replaces the DFF column.
+# Only rows matched to a BettingPros line count; salary-only rows have their points filled with 0
+blender = ProjectionBlender(BLEND_WEIGHTS)
+bettingpros_lines = nfl_fantasy_combined[nfl_fantasy_combined['_merge'] == 'both']
+blender.set_source('bettingpros', source_from_frame(bettingpros_lines, BLEND_KEYS, 'points'))
+
+
+def blend_site(cheatsheet):
+    if DFF_PROJECTION_COLUMN in cheatsheet.columns:
+        blender.set_source('dailyfantasyfuel', source_from_frame(cheatsheet, BLEND_KEYS, DFF_PROJECTION_COLUMN))
+    elif 'dailyfantasyfuel' in blender.matrix.columns:
+        blender.remove_source('dailyfantasyfuel')
+
+    merged = pd.merge(nfl_fantasy_combined, cheatsheet,
+                      on=BLEND_KEYS,
+                      how='inner')
+    # Prefix the blend columns so they cannot collide with columns of the external cheatsheet
+    blended = blender.blend()[['mean', 'spread']].rename(columns={'mean': 'blend_mean', 'spread': 'blend_spread'})
+    merged = merged.join(blended, on=BLEND_KEYS)
+    # Players no source projects (salary-only rows with a blank DFF projection) score 0, as before
+    merged['points'] = merged['blend_mean'].fillna(0)
+    merged['points_spread'] = merged['blend_spread'].fillna(0)
+    return merged[['first_initial', 'last_name', 'team', 'position', 'points', 'points_spread', 'salary_y']]
+
+
 # Merge the DataFrames for FanDuel
-fd_merged = pd.merge(nfl_fantasy_combined, dff_nfl_cheatsheet_fd,
-                    on=['last_name', 'team', 'position'],
-                    how='inner')
-fd_output_df = fd_merged[['first_initial', 'last_name', 'team', 'position', 'points', 'salary_y']]
+fd_output_df = blend_site(dff_nfl_cheatsheet_fd)
 print(fd_output_df.head())
 fd_output_df.to_csv('FD_single_game.csv', index=False)
 
 # Merge the DataFrames for DraftKings
-dk_merged = pd.merge(nfl_fantasy_combined, dff_nfl_cheatsheet_dk,
-                    on=['last_name', 'team', 'position'],
-                    how='inner')
-dk_output_df = dk_merged[['first_initial', 'last_name', 'team', 'position', 'points', 'salary_y']]
+dk_output_df = blend_site(dff_nfl_cheatsheet_dk)
 print(dk_output_df.head())
 dk_output_df.to_csv('DK_single_game.csv', index=False)
\ No newline at end of file
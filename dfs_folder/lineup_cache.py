@@ -0,0 +1,125 @@
+import copy
+import glob
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+
+
+class LineupCache:
+    """Two-tier (memory LRU + disk) cache of optimizer results.
+
+    Entries are keyed by a hash of the pool file contents plus a hash of the normalized request,
+    so editing the pool file never serves an old lineup. Entries for a pool that has changed on
+    disk are dropped the next time that file is looked up.
+    """
+
+    def __init__(self, cache_dir='.lineup_cache', max_memory_entries=128, max_disk_entries=1024):
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.memory = OrderedDict()
+        # path -> ((mtime_ns, size), digest), so unchanged files are not re-hashed on every call
+        self.pool_digests = {}
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    def pool_digest(self, csv_file):
+        path = os.path.abspath(csv_file)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        known = self.pool_digests.get(path)
+        if known is not None and known[0] == signature:
+            return known[1]
+
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if known is not None and known[1] != digest:
+            self.invalidate(known[1])
+        self.pool_digests[path] = (signature, digest)
+        return digest
+
+    def make_key(self, csv_file, **params):
+        """Build the cache key from the request parameters exactly as given.
+
+        Callers must normalize parameters before calling this and solve with those same values,
+        so two requests only share a key when they would produce the same result.
+        """
+        request = json.dumps(params, sort_keys=True, default=str)
+        return self.pool_digest(csv_file), hashlib.sha256(request.encode()).hexdigest()
+
+    def disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key[0]}-{key[1]}.pkl")
+
+    def get(self, key):
+        """Return a copy of the cached result, or None on a miss"""
+        if key in self.memory:
+            self.memory.move_to_end(key)
+            self.stats['memory_hits'] += 1
+            return copy.deepcopy(self.memory[key])
+
+        try:
+            with open(self.disk_path(key), 'rb') as f:
+                result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self.stats['misses'] += 1
+            return None
+
+        self.stats['disk_hits'] += 1
+        self.remember(key, result)
+        return copy.deepcopy(result)
+
+    def put(self, key, result):
+        result = copy.deepcopy(result)
+        self.remember(key, result)
+
+        # The disk tier is best effort: a failed write must not lose the result that was just solved
+        path = self.disk_path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(result, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Could not write lineup cache entry to disk: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self.evict_disk()
+
+    def remember(self, key, result):
+        self.memory[key] = result
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.max_memory_entries:
+            self.memory.popitem(last=False)
+
+    def evict_disk(self):
+        entries = glob.glob(os.path.join(self.cache_dir, '*.pkl'))
+        if len(entries) <= self.max_disk_entries:
+            return
+        entries.sort(key=os.path.getmtime)
+        for path in entries[:len(entries) - self.max_disk_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def invalidate(self, pool_digest=None):
+        """Drop every entry for one pool, or the whole cache when pool_digest is None"""
+        for key in [k for k in self.memory if pool_digest is None or k[0] == pool_digest]:
+            del self.memory[key]
+        pattern = f"{pool_digest}-*.pkl" if pool_digest else '*.pkl'
+        for path in glob.glob(os.path.join(self.cache_dir, pattern)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def hit_rate(self):
+        lookups = sum(self.stats.values())
+        hits = self.stats['memory_hits'] + self.stats['disk_hits']
+        return hits / lookups if lookups else 0.0
@@ -4,6 +4,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pandas as pd
 import re
+from projection_blend import ProjectionBlender, source_from_frame
+
+# Columns that identify a player across projection sources
+BLEND_KEYS = ['Player', 'Team', 'Position']
 
 
 def normalize_player_name(name):
@@ -159,10 +163,17 @@ def scrape_salaries(url):
         driver.quit()
 
 
-def combine_data(salary_data, points_data):
+def combine_data(salary_data, points_data, extra_projections=None, weights=None):
     # Convert lists of dictionaries to DataFrames
     salary_df = pd.DataFrame(salary_data)
-    points_df = pd.DataFrame(points_data)
+
+    # Blend the BettingPros points with any other sources (name -> records shaped like points_data)
+    blender = ProjectionBlender(weights)
+    blender.set_source('bettingpros', source_from_frame(pd.DataFrame(points_data), BLEND_KEYS, 'Points'))
+    for name, projections in (extra_projections or {}).items():
+        blender.set_source(name, source_from_frame(pd.DataFrame(projections), BLEND_KEYS, 'Points'))
+    points_df = blender.blend().rename(columns={'mean': 'Points', 'spread': 'Points_Spread'})
+    points_df = points_df[['Points', 'Points_Spread']].reset_index()
 
     # Merge the dataframes on Player name AND team
     combined_df = pd.merge(salary_df, points_df,
@@ -172,6 +183,7 @@ def combine_data(salary_data, points_data):
 
     # Fill any missing values
     combined_df['Points'] = combined_df['Points'].fillna(0)
+    combined_df['Points_Spread'] = combined_df['Points_Spread'].fillna(0)
     combined_df['Salary'] = combined_df['Salary'].fillna(0)
     combined_df['Position'] = combined_df['Position'].fillna('Unknown')
     combined_df['Team'] = combined_df['Team'].fillna('Unknown')
@@ -2,9 +2,25 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from time import sleep
+from time import sleep, monotonic
 import pandas as pd
 
+# Watches only the list that holds the odds-offer nodes (not the whole page, where live odds and
+# ads change constantly) and stamps the time its children last changed. The observer is moved
+# if the page re-renders the list. Returns [number of odds-offer nodes, ms since the list changed]
+LOAD_STATE_JS = """
+const offer = document.querySelector('.odds-offer');
+const container = offer ? offer.parentElement : null;
+if (container && window.__oddsContainer !== container) {
+    if (window.__oddsObserver) { window.__oddsObserver.disconnect(); }
+    window.__oddsContainer = container;
+    window.__lastMutation = performance.now();
+    window.__oddsObserver = new MutationObserver(() => { window.__lastMutation = performance.now(); });
+    window.__oddsObserver.observe(container, {childList: true});
+}
+return [document.getElementsByClassName('odds-offer').length,
+        performance.now() - (window.__lastMutation || 0)];
+"""
 
 
 def normalize_team_name(team):
@@ -27,6 +43,55 @@ def extract_team_position(text):
     if len(parts) == 2:
         return parts[0].strip(), parts[1].strip()
     return None, None
+
+
+def record_wait(wait_log, label, started):
+    """Append how long a wait took to the log and return the elapsed seconds"""
+    elapsed = monotonic() - started
+    wait_log.append((label, elapsed))
+    return elapsed
+
+
+def print_wait_log(wait_log):
+    total = sum(elapsed for _, elapsed in wait_log)
+    print(f"Time spent waiting: {total:.2f}s over {len(wait_log)} waits")
+    for label, elapsed in wait_log:
+        print(f"  {label:<20}{elapsed:.2f}s")
+
+
+def scroll_until_loaded(driver, wait_log, poll_interval=0.25, stall_timeout=3.0, max_time=60.0):
+    """Scroll until the odds-offer count stops growing for stall_timeout seconds"""
+    last_count, _ = driver.execute_script(LOAD_STATE_JS)
+    scroll_started = monotonic()
+
+    while monotonic() - scroll_started < max_time:
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+
+        # Poll until more offers render or the count has stalled. Recent changes to the offer
+        # list itself (e.g. loading placeholders) buy at most one extra stall_timeout
+        started = monotonic()
+        while True:
+            sleep(poll_interval)
+            count, quiet_ms = driver.execute_script(LOAD_STATE_JS)
+            if count > last_count:
+                break
+            unchanged = monotonic() - started
+            if unchanged >= stall_timeout and (quiet_ms / 1000 >= stall_timeout or unchanged >= 2 * stall_timeout):
+                break
+            if monotonic() - scroll_started >= max_time:
+                break
+
+        elapsed = record_wait(wait_log, f"scroll ({count} offers)", started)
+        if count <= last_count:
+            print(f"No new offers after {elapsed:.2f}s, list fully loaded")
+            return count
+        last_count = count
+        print(f"Scrolling... {count} offers loaded")
+
+    print(f"Stopped scrolling after {max_time:.0f}s with {last_count} offers loaded")
+    return last_count
+
+
 def scrape_betting_pros(url):
     options = webdriver.ChromeOptions()
     options.add_argument('--disable-blink-features=AutomationControlled')
@@ -35,31 +100,21 @@ def scrape_betting_pros(url):
     options.add_experimental_option('useAutomationExtension', False)
 
     driver = webdriver.Chrome(options=options)
+    wait_log = []
 
     try:
         print("Accessing website...")
         driver.get(url)
 
+        started = monotonic()
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.CLASS_NAME, "odds-offer"))
         )
+        record_wait(wait_log, "first offer", started)
 
         print("Starting to scroll and collect data...")
-
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        scroll_attempts = 0
-        max_attempts = 30
-
-        while scroll_attempts < max_attempts:
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            sleep(2)
-
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
-            scroll_attempts += 1
-            print(f"Scrolling... attempt {scroll_attempts}")
+        scroll_until_loaded(driver, wait_log)
+        print_wait_log(wait_log)
 
         print("Collecting player data...")
 
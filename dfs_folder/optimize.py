@@ -1,8 +1,39 @@
 import pandas as pd
 from pulp import *
+from presolve import prune_dominated
+from lineup_cache import LineupCache
 
+# Most players of each position a classic lineup can hold: the position minimum plus the one
+# spot left over once every other position minimum is filled (8 players total, exactly 1 QB)
+CLASSIC_MAX_PER_POSITION = {'QB': 1, 'RB': 3, 'WR': 4, 'TE': 2}
 
-def optimize_lineup(csv_file, budget, team_filter=None, exclude_players=None, mode='classic'):
+# A showdown lineup is 1 captain + 5 players drawn from the same pool regardless of position
+SHOWDOWN_LINEUP_SIZE = 6
+
+# Results of previous optimizations, keyed by pool file contents and request parameters
+lineup_cache = LineupCache()
+
+
+def optimize_lineup(csv_file, budget, team_filter=None, exclude_players=None, mode='classic', presolve=True,
+                    use_cache=True):
+    # Normalize once so the cache key and the solver see exactly the same request. Order and
+    # duplicates never matter; player exclusions are case-insensitive but team filters are not
+    team_filter = sorted(set(team_filter or []))
+    exclude_players = sorted({name.upper() for name in exclude_players or []})
+
+    if not use_cache:
+        return solve_lineup(csv_file, budget, team_filter, exclude_players, mode, presolve)
+
+    key = lineup_cache.make_key(csv_file, budget=budget, team_filter=team_filter,
+                                exclude_players=exclude_players, mode=mode, presolve=presolve)
+    result = lineup_cache.get(key)
+    if result is None:
+        result = solve_lineup(csv_file, budget, team_filter, exclude_players, mode, presolve)
+        lineup_cache.put(key, result)
+    return result
+
+
+def solve_lineup(csv_file, budget, team_filter=None, exclude_players=None, mode='classic', presolve=True):
     # Read the CSV file
     df = pd.read_csv(csv_file)
 
@@ -19,6 +50,13 @@ def optimize_lineup(csv_file, budget, team_filter=None, exclude_players=None, mo
         exclude_players = [name.upper() for name in exclude_players]
         df = df[~df['Player'].str.upper().isin(exclude_players)]
 
+    # Remove players that can never make the optimal lineup before building the model
+    if presolve:
+        if mode == 'classic':
+            df = prune_dominated(df, CLASSIC_MAX_PER_POSITION, position_col='Position')
+        else:
+            df = prune_dominated(df, SHOWDOWN_LINEUP_SIZE)
+
     # Reset index after filtering
     df = df.reset_index(drop=True)
 
@@ -107,7 +145,8 @@ def optimize_lineup(csv_file, budget, team_filter=None, exclude_players=None, mo
                     'Team': player['Team'],
                     'Position': player['Position'],
                     'Salary': player['Salary'],
-                    'Points': player['Points']
+                    'Points': player['Points'],
+                    'Spread': player.get('Points_Spread', 0.0)
                 })
                 total_salary += player['Salary']
                 total_points += player['Points']
@@ -121,7 +160,8 @@ def optimize_lineup(csv_file, budget, team_filter=None, exclude_players=None, mo
                     'Team': player['Team'],
                     'Position': f"CPT {player['Position']}",
                     'Salary': int(player['Salary'] * 1.5),
-                    'Points': player['Points'] * 1.5
+                    'Points': player['Points'] * 1.5,
+                    'Spread': player.get('Points_Spread', 0.0) * 1.5
                 })
                 total_salary += int(player['Salary'] * 1.5)
                 total_points += player['Points'] * 1.5
@@ -135,7 +175,8 @@ def optimize_lineup(csv_file, budget, team_filter=None, exclude_players=None, mo
                     'Team': player['Team'],
                     'Position': player['Position'],
                     'Salary': player['Salary'],
-                    'Points': player['Points']
+                    'Points': player['Points'],
+                    'Spread': player.get('Points_Spread', 0.0)
                 })
                 total_salary += player['Salary']
                 total_points += player['Points']
@@ -168,7 +209,7 @@ def print_lineup(result):
 
     print("\nOptimal Lineup:")
     print("-" * 80)
-    print(f"{'Position':<10}{'Player':<20}{'Team':<8}{'Salary':<12}{'Projected':<10}")
+    print(f"{'Position':<10}{'Player':<20}{'Team':<8}{'Salary':<12}{'Projected':<10}{'Spread':<8}")
     print("-" * 80)
 
     for player in result['lineup']:
@@ -176,7 +217,8 @@ def print_lineup(result):
               f"{player['Player']:<20}"
               f"{player['Team']:<8}"
               f"${player['Salary']:<11,}"
-              f"{player['Points']:<10.2f}")
+              f"{player['Points']:<10.2f}"
+              f"{player.get('Spread', 0.0):<8.2f}")
     print("-" * 80)
 
 
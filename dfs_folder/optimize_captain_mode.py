@@ -1,12 +1,19 @@
 import pandas as pd
 from pulp import LpMaximize, LpProblem, LpVariable, lpSum, LpSolverDefault
+from presolve import prune_dominated
 
 # Load data
 dk_data = pd.read_csv('DK_single_game.csv')
 fd_data = pd.read_csv('FD_single_game.csv')
 
 
-def optimize_team(data, budget, num_players, multiplier_on_first_player=False, dk_mode=False):
+def optimize_team(data, budget, num_players, multiplier_on_first_player=False, dk_mode=False, presolve=True):
+    # Remove players that can never make the optimal team. The first player carries the
+    # multipliers, so it is kept as is and never used to rule out anyone else
+    if presolve:
+        data = prune_dominated(data, num_players, points_col='points', salary_col='salary_y', protected=[0])
+        data = data.reset_index(drop=True)
+
     # Create the problem
     prob = LpProblem("Optimal_Team", LpMaximize)
 
@@ -40,12 +47,19 @@ def optimize_team(data, budget, num_players, multiplier_on_first_player=False, d
     total_points = 0
     total_budget = 0
 
+    # Blended projections also carry how much the sources disagree on each player
+    output_columns = ['first_initial', 'last_name', 'team', 'position', 'points', 'salary_y']
+    if 'points_spread' in data.columns:
+        output_columns.insert(5, 'points_spread')
+
     for i in range(len(data)):
         if player_vars[i].value() == 1:
-            player_info = data.loc[i, ['first_initial', 'last_name', 'team', 'position', 'points', 'salary_y']].copy()
+            player_info = data.loc[i, output_columns].copy()
             # Adjust points and salary if it's the first player and mode requires multipliers
             if i == 0:
                 player_info['points'] *= 1.5
+                if 'points_spread' in player_info:
+                    player_info['points_spread'] *= 1.5
                 if dk_mode:
                     player_info['salary_y'] *= 1.5
             total_points += player_info['points']
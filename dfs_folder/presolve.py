@@ -0,0 +1,54 @@
+import numpy as np
+
+
+def count_dominators(points, salaries):
+    """For each player, count the players that cost no more and project no fewer points.
+
+    Exact ties are broken by row order so that two identical players never dominate each other.
+    """
+    order = np.arange(len(points))
+    # Row p, column q answers "does q dominate p?"
+    cheaper_or_equal = salaries[None, :] <= salaries[:, None]
+    better_or_equal = points[None, :] >= points[:, None]
+    strictly_better = ((salaries[None, :] < salaries[:, None]) |
+                       (points[None, :] > points[:, None]) |
+                       (order[None, :] < order[:, None]))
+    return (cheaper_or_equal & better_or_equal & strictly_better).sum(axis=1)
+
+
+def prune_dominated(df, max_counts, points_col='Points', salary_col='Salary', position_col=None, protected=None):
+    """Drop players that can never be part of an optimal lineup.
+
+    A player is dominated when at least as many players as the lineup can hold at that position
+    are both cheaper (or equal) and projected higher (or equal): any lineup using them can swap
+    in one of those players without costing salary or points. max_counts is a dict of
+    position -> most players of that position a lineup can hold, or a single int when
+    position_col is None and the whole pool is one group. Positions missing from max_counts and
+    protected row labels are always kept and never count as dominators.
+    """
+    keep = np.ones(len(df), dtype=bool)
+    candidates = np.ones(len(df), dtype=bool)
+    if protected is not None:
+        candidates &= ~df.index.isin(protected)
+
+    if position_col is None:
+        groups = [(max_counts, candidates)]
+    else:
+        positions = df[position_col].to_numpy()
+        groups = [(max_counts[pos], candidates & (positions == pos))
+                  for pos in max_counts]
+
+    points = df[points_col].to_numpy(dtype=float)
+    salaries = df[salary_col].to_numpy(dtype=float)
+
+    for limit, mask in groups:
+        rows = np.flatnonzero(mask)
+        if len(rows) <= limit:
+            continue
+        dominators = count_dominators(points[rows], salaries[rows])
+        keep[rows[dominators >= limit]] = False
+
+    pruned = df[keep]
+    print(f"Presolve: removed {len(df) - len(pruned)} dominated players "
+          f"({len(df)} -> {len(pruned)})")
+    return pruned
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+
+def source_from_frame(df, key_columns, value_column):
+    """Turn a projections table into a Series of points indexed by the player key columns"""
+    projections = df.set_index(key_columns)[value_column].astype(float)
+    # Keep one projection per player if a source lists someone twice
+    return projections.groupby(level=list(range(len(key_columns)))).mean()
+
+
+class ProjectionBlender:
+    """Blends player projections from any number of sources.
+
+    Every source is one column of a player x source matrix. Weighted sums of the projections and
+    their squares, and the number of sources covering each player, are kept per player, so
+    replacing one source only subtracts its old column and adds the new one; the rest of the
+    matrix is never re-read. The weighted median is the exception: an order statistic cannot be
+    updated from a single column, so it is recomputed from the whole matrix on the next blend()
+    after a change and cached until the following one. Missing projections are ignored, so a
+    player's blend uses only the sources that cover them.
+    """
+
+    def __init__(self, weights=None):
+        self.weights = dict(weights or {})
+        self.matrix = pd.DataFrame(dtype=float)
+        self.weighted_sum = np.zeros(0)
+        self.weighted_square_sum = np.zeros(0)
+        self.weight_total = np.zeros(0)
+        self.source_count = np.zeros(0, dtype=int)
+        # Weight each column was added with, so it can be removed exactly even if weights change
+        self.applied_weights = {}
+        self.median_cache = None
+
+    def set_source(self, name, projections, weight=None):
+        """Add or replace one source's projections (a Series indexed by player key)"""
+        projections = projections.astype(float)
+        if weight is not None:
+            self.weights[name] = weight
+        weight = self.weights.setdefault(name, 1.0)
+
+        if name in self.matrix.columns:
+            if (self.applied_weights[name] == weight and
+                    projections.reindex(self.matrix.index).equals(self.matrix[name]) and
+                    projections.index.isin(self.matrix.index).all()):
+                return
+            self.apply_column(name, remove=True)
+
+        if len(self.matrix.columns) == 0:
+            self.matrix = pd.DataFrame(index=projections.index)
+            self.resize(len(projections))
+        elif not projections.index.isin(self.matrix.index).all():
+            new_index = self.matrix.index.append(projections.index.difference(self.matrix.index))
+            self.matrix = self.matrix.reindex(new_index)
+            self.resize(len(new_index))
+
+        self.matrix[name] = projections.reindex(self.matrix.index)
+        self.apply_column(name)
+
+    def remove_source(self, name):
+        self.apply_column(name, remove=True)
+        self.matrix = self.matrix.drop(columns=name)
+
+    def set_weight(self, name, weight):
+        self.weights[name] = weight
+        if name in self.matrix.columns:
+            self.apply_column(name, remove=True)
+            self.apply_column(name)
+
+    def resize(self, size):
+        """Grow the running sums when new players appear (existing rows keep their position)"""
+        grow = size - len(self.weighted_sum)
+        self.weighted_sum = np.concatenate([self.weighted_sum, np.zeros(grow)])
+        self.weighted_square_sum = np.concatenate([self.weighted_square_sum, np.zeros(grow)])
+        self.weight_total = np.concatenate([self.weight_total, np.zeros(grow)])
+        self.source_count = np.concatenate([self.source_count, np.zeros(grow, dtype=int)])
+
+    def apply_column(self, name, remove=False):
+        values = self.matrix[name].to_numpy(dtype=float)
+        present = ~np.isnan(values)
+        values = np.where(present, values, 0.0)
+
+        if remove:
+            weight = -self.applied_weights.pop(name)
+            self.source_count -= present
+        else:
+            weight = self.weights[name]
+            self.applied_weights[name] = weight
+            self.source_count += present
+
+        self.weighted_sum += weight * values
+        self.weighted_square_sum += weight * values ** 2
+        self.weight_total += weight * present
+        self.median_cache = None
+
+    def weighted_median(self):
+        """Per-player weighted median; the midpoint is used when the weight splits exactly in half"""
+        values = self.matrix.to_numpy(dtype=float)
+        # With every source removed there is nothing to rank
+        if values.shape[1] == 0:
+            return np.full(len(values), np.nan)
+        weights = np.array([self.applied_weights[name] for name in self.matrix.columns], dtype=float)
+        weights = np.where(np.isnan(values), 0.0, weights)
+
+        # argsort puts missing projections last, where their zero weight changes nothing
+        order = np.argsort(values, axis=1)
+        sorted_values = np.take_along_axis(values, order, axis=1)
+        cumulative = np.cumsum(np.take_along_axis(weights, order, axis=1), axis=1)
+        total = cumulative[:, -1:]
+        half = total / 2
+        tolerance = 1e-9 * np.abs(total)
+
+        rows = np.arange(len(values))
+        lower = np.argmax(cumulative >= half - tolerance, axis=1)
+        upper = np.argmax(cumulative > half + tolerance, axis=1)
+        median = (sorted_values[rows, lower] + sorted_values[rows, upper]) / 2
+        median[total[:, 0] <= 1e-12] = np.nan
+        return median
+
+    def blend(self):
+        """Return one row per player with the weighted mean, median, spread and source count"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self.weighted_sum / self.weight_total
+            variance = self.weighted_square_sum / self.weight_total - mean ** 2
+        # Removing a source can leave rounding residue instead of an exact zero weight
+        mean[self.weight_total <= 1e-12] = np.nan
+        spread = np.sqrt(np.clip(variance, 0, None))
+
+        if self.median_cache is None:
+            self.median_cache = self.weighted_median()
+
+        return pd.DataFrame({
+            'mean': mean,
+            'median': self.median_cache,
+            'spread': spread,
+            'sources': self.source_count.copy()
+        }, index=self.matrix.index)